@@ -4,96 +4,283 @@ Enhanced Markdown Server with Beautiful Styling
 Serves markdown files with GitHub-like styling and syntax highlighting
 """
 
+import functools
+import gzip
+import hashlib
 import http.server
-import socketserver
-import markdown
+import mistune
 import os
 import sys
-from urllib.parse import unquote
+import threading
+from collections import OrderedDict
+from urllib.parse import unquote, urlsplit
 from pathlib import Path
 
-class MarkdownHandler(http.server.SimpleHTTPRequestHandler):
-    def do_GET(self):
-        # Parse the path
-        path = unquote(self.path)
-        
-        # Remove query parameters
-        if '?' in path:
-            path = path.split('?')[0]
-        
-        # Default to IMPLEMENTATION.md if accessing root
-        if path == '/':
-            path = '/IMPLEMENTATION_GUIDE.md'
-        
-        # Remove leading slash
-        if path.startswith('/'):
-            path = path[1:]
-        
-        # Check if it's a markdown file
-        if path.endswith('.md'):
-            try:
-                # Read markdown file
-                with open(path, 'r', encoding='utf-8') as f:
-                    markdown_content = f.read()
-                
-                # Process Mermaid code blocks before markdown conversion
-                markdown_content = self.process_mermaid_blocks(markdown_content)
-                
-                # Configure markdown with extensions
-                md = markdown.Markdown(extensions=[
-                    'markdown.extensions.codehilite',
-                    'markdown.extensions.fenced_code',
-                    'markdown.extensions.tables',
-                    'markdown.extensions.toc',
-                    'markdown.extensions.nl2br',
-                ])
-                
-                # Convert to HTML
-                html_content = md.convert(markdown_content)
-                
-                # Create full HTML page with styling
-                full_html = self.create_html_page(html_content, path)
-                
-                # Send response
-                self.send_response(200)
-                self.send_header('Content-Type', 'text/html; charset=utf-8')
-                self.send_header('Content-Length', str(len(full_html.encode('utf-8'))))
-                self.end_headers()
-                self.wfile.write(full_html.encode('utf-8'))
-                
-            except FileNotFoundError:
-                self.send_error(404, f"File not found: {path}")
-            except Exception as e:
-                self.send_error(500, f"Error processing markdown: {str(e)}")
+# Mistune plugins (also part of the render cache key, so changing the
+# plugin set invalidates cached responses). Code blocks come out as
+# <pre><code class="language-...">, which the page's highlight.js picks up.
+# main() narrows this to the subset the served docs actually use, so
+# unneeded block/inline rules never run.
+MARKDOWN_PLUGINS = (
+    'table',
+    'footnotes',
+    'url',
+    'task_lists',
+    'strikethrough',
+)
+
+# Cheap syntax markers indicating a plugin's feature appears in a document
+_PLUGIN_MARKERS = (
+    ('table', ('|',)),
+    ('footnotes', ('[^',)),
+    ('url', ('http://', 'https://')),
+    ('task_lists', ('- [ ]', '- [x]', '- [X]')),
+    ('strikethrough', ('~~',)),
+)
+
+def _detect_plugins():
+    """Return the subset of MARKDOWN_PLUGINS the served docs actually use"""
+    needed = set()
+    for md_file in _DOCROOT.rglob('*.md'):
+        try:
+            text = md_file.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError):
+            continue
+        for plugin, markers in _PLUGIN_MARKERS:
+            if plugin not in needed and any(marker in text for marker in markers):
+                needed.add(plugin)
+        if len(needed) == len(MARKDOWN_PLUGINS):
+            break
+    return tuple(p for p in MARKDOWN_PLUGINS if p in needed)
+
+# Cache of fully rendered HTML responses, keyed by a content hash of
+# (path, file mtime, plugin set). Docs are essentially static, so repeat
+# requests skip markdown conversion entirely. Each entry holds the raw and
+# gzip-compressed bytes so compression also happens once per document.
+# Bounded FIFO to cap memory.
+_RESPONSE_CACHE_MAX = 4096
+_response_cache = OrderedDict()
+_response_cache_lock = threading.Lock()
+_response_cache_hits = 0
+_response_cache_misses = 0
+
+# Directory the server was started in; markdown requests resolving outside
+# it are rejected up front instead of paying for a failed open()
+_DOCROOT = Path.cwd().resolve()
+
+# Frontend assets served from ./static instead of CDNs, so page loads make
+# no cross-origin requests and repeat visits hit the browser cache. They
+# are fetched once at startup if missing (they are too big to vendor in
+# the repo) and served with an immutable one-year Cache-Control; the local
+# filenames carry the pinned version so a version bump changes the URL and
+# reaches browsers that cached the old one.
+STATIC_DIR = _DOCROOT / 'static'
+STATIC_ASSETS = {
+    'mermaid-10.6.1.min.js': 'https://cdn.jsdelivr.net/npm/mermaid@10.6.1/dist/mermaid.min.js',
+    'github-11.9.0.min.css': 'https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/styles/github.min.css',
+    'highlight-11.9.0.min.js': 'https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/highlight.min.js',
+}
+
+def _ensure_static_assets():
+    """Fetch the pinned assets into static/, or fall back to CDN links
+
+    An asset that cannot be downloaded (e.g. no egress from the cluster)
+    keeps its CDN URL in the page template, so diagrams and highlighting
+    still work for any client that can reach the CDN itself.
+    """
+    global _PAGE_MID
+    STATIC_DIR.mkdir(exist_ok=True)
+    for name, url in STATIC_ASSETS.items():
+        asset = STATIC_DIR / name
+        if asset.exists():
+            continue
+        try:
+            from urllib.request import urlopen
+            with urlopen(url) as resp:
+                asset.write_bytes(resp.read())
+            print(f"⬇️  Downloaded {name}")
+        except OSError as e:
+            print(f"⚠️  Could not download {name} ({e}); using the CDN link")
+            _PAGE_MID = _PAGE_MID.replace(
+                b'/static/' + name.encode('ascii'), url.encode('ascii'))
+    # Pages assembled before the fallback rewrite would keep dead links
+    create_html_page.cache_clear()
+
+# Source cache so unchanged .md files skip the filesystem read; entries are
+# (mtime_ns, bytes), invalidated whenever the file's mtime moves. LRU
+# bounded to keep memory flat no matter how many docs are served. Files are
+# kept as raw bytes so mermaid preprocessing runs before the single decode.
+_FILE_CACHE_MAX = 256
+_file_cache = OrderedDict()
+_file_cache_lock = threading.Lock()
+
+def _read_markdown(path, stat_result):
+    with _file_cache_lock:
+        entry = _file_cache.get(path)
+        if entry is not None and entry[0] == stat_result.st_mtime_ns:
+            _file_cache.move_to_end(path)
+            return entry[1]
+    with open(path, 'rb') as f:
+        data = f.read()
+    with _file_cache_lock:
+        _file_cache[path] = (stat_result.st_mtime_ns, data)
+        _file_cache.move_to_end(path)
+        while len(_file_cache) > _FILE_CACHE_MAX:
+            _file_cache.popitem(last=False)
+    return data
+
+# Mermaid fences are simple delimited spans, so they are located with a
+# linear scan over bytes.find (C memmem, no regex backtracking)
+_MERMAID_OPEN = b'```mermaid\n'
+_MERMAID_CLOSE = b'\n```'
+
+def _scan_mermaid_fences(buf):
+    """Find every mermaid fence in one linear pass over the buffer
+
+    Returns (fence_start, code_start, code_end, fence_end) spans, so
+    callers can splice the diagram bodies without rescanning.
+    """
+    spans = []
+    pos = 0
+    find = buf.find
+    while True:
+        fence_start = find(_MERMAID_OPEN, pos)
+        if fence_start < 0:
+            return spans
+        code_start = fence_start + len(_MERMAID_OPEN)
+        code_end = find(_MERMAID_CLOSE, code_start)
+        if code_end < 0:
+            return spans
+        fence_end = code_end + len(_MERMAID_CLOSE)
+        spans.append((fence_start, code_start, code_end, fence_end))
+        pos = fence_end
+
+# Single-line HTML comments pass through the markdown parser untouched,
+# whether they land in a block or inside a paragraph
+_MERMAID_PLACEHOLDER = b'<!--mermaid:%d-->'
+
+def _extract_mermaid_fences(buf):
+    """Swap mermaid fences for opaque placeholders, returning the bodies
+
+    Diagram text must reach the browser verbatim, but a <div> left in the
+    markdown source only survives as one HTML block until the first blank
+    line — after that the parser re-processes the rest of the diagram. So
+    the bodies are pulled out before parsing and spliced back afterwards.
+    """
+    # Fast path: most documents have no mermaid blocks, and a substring
+    # scan is far cheaper than walking the fences
+    if b'```mermaid' not in buf:
+        return buf, []
+
+    parts = []
+    bodies = []
+    last = 0
+    for fence_start, code_start, code_end, fence_end in _scan_mermaid_fences(buf):
+        parts.append(buf[last:fence_start])
+        parts.append(_MERMAID_PLACEHOLDER % len(bodies))
+        bodies.append(buf[code_start:code_end])
+        last = fence_end
+    parts.append(buf[last:])
+    return b''.join(parts), bodies
+
+def _restore_mermaid_blocks(html, bodies):
+    """Replace each placeholder in the rendered HTML with its mermaid div"""
+    for i, body in enumerate(bodies):
+        placeholder = (_MERMAID_PLACEHOLDER % i).decode('ascii')
+        div = f'<div class="mermaid">\n{body.decode("utf-8")}\n</div>'
+        html = html.replace(placeholder, div)
+    return html
+
+def _render_document(path, stat_result):
+    """Run the full render pipeline for one file, returning (raw, gzip) bytes"""
+    markdown_content, diagrams = _extract_mermaid_fences(_read_markdown(path, stat_result))
+    html_content = _get_markdown()(markdown_content.decode('utf-8'))
+    if diagrams:
+        html_content = _restore_mermaid_blocks(html_content, diagrams)
+    raw = create_html_page(html_content, path)
+    return (raw, gzip.compress(raw, compresslevel=6))
+
+def _prerender(paths):
+    """Warm the response cache so first visits skip all markdown work"""
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        _cache_put(_response_cache_key(path, st), _render_document(path, st))
+
+# Reusable per-thread response buffers; rendered pages run tens of KB and
+# reusing one bytearray per worker avoids reallocating it every request
+_buf_local = threading.local()
+
+def _response_buffer():
+    buf = getattr(_buf_local, 'buf', None)
+    if buf is None:
+        buf = _buf_local.buf = bytearray()
+    else:
+        buf.clear()
+    return buf
+
+# Markdown renderers are kept per worker thread (the server handles each
+# connection on its own thread); plugin registration and parser setup are
+# done once per thread rather than per document.
+_md_local = threading.local()
+
+def _get_markdown():
+    md = getattr(_md_local, 'md', None)
+    if md is None:
+        md = _md_local.md = mistune.create_markdown(
+            plugins=list(MARKDOWN_PLUGINS), escape=False)
+    return md
+
+def _response_cache_key(path, stat_result):
+    raw = f"{path}:{stat_result.st_mtime_ns}:{stat_result.st_size}:{MARKDOWN_PLUGINS}"
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()[:16]
+
+def _cache_get(key):
+    global _response_cache_hits, _response_cache_misses
+    with _response_cache_lock:
+        cached = _response_cache.get(key)
+        if cached is None:
+            _response_cache_misses += 1
         else:
-            # Serve other files normally
-            super().do_GET()
-    
-    def process_mermaid_blocks(self, content):
-        """Convert mermaid code blocks to HTML divs with mermaid class"""
-        import re
-        
-        # Pattern to match mermaid code blocks
-        pattern = r'```mermaid\n(.*?)\n```'
-        
-        def replace_mermaid(match):
-            mermaid_code = match.group(1)
-            return f'<div class="mermaid">\n{mermaid_code}\n</div>'
-        
-        # Replace all mermaid code blocks
-        return re.sub(pattern, replace_mermaid, content, flags=re.DOTALL)
-    
-    def create_html_page(self, content, title):
-        return f"""<!DOCTYPE html>
+            _response_cache_hits += 1
+        return cached
+
+def _cache_put(key, value):
+    with _response_cache_lock:
+        _response_cache[key] = value
+        while len(_response_cache) > _RESPONSE_CACHE_MAX:
+            _response_cache.popitem(last=False)
+
+def _cache_clear():
+    """Drop all cached responses (useful when editing docs while serving)."""
+    global _response_cache_hits, _response_cache_misses
+    with _response_cache_lock:
+        _response_cache.clear()
+        _response_cache_hits = 0
+        _response_cache_misses = 0
+
+def _cache_stats():
+    """Return (entries, hits, misses) for the rendered-response cache."""
+    with _response_cache_lock:
+        return (len(_response_cache), _response_cache_hits, _response_cache_misses)
+
+# Static HTML page chrome, pre-encoded once; only the title and rendered
+# body vary per request, so pages are assembled with a join of bytes
+# instead of re-formatting the full template
+_PAGE_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title}</title>
-    <script src="https://cdn.jsdelivr.net/npm/mermaid@10.6.1/dist/mermaid.min.js"></script>
+    <title>""".encode('utf-8')
+
+_PAGE_MID = """</title>
+    <script src="/static/mermaid-10.6.1.min.js"></script>
     <style>
         /* GitHub-like styling */
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', 'Noto Sans', Helvetica, Arial, sans-serif;
             font-size: 16px;
             line-height: 1.5;
@@ -102,41 +289,41 @@ class MarkdownHandler(http.server.SimpleHTTPRequestHandler):
             max-width: 1200px;
             margin: 0 auto;
             padding: 20px;
-        }}
+        }
         
-        h1, h2, h3, h4, h5, h6 {{
+        h1, h2, h3, h4, h5, h6 {
             margin-top: 24px;
             margin-bottom: 16px;
             font-weight: 600;
             line-height: 1.25;
-        }}
+        }
         
-        h1 {{
+        h1 {
             font-size: 2em;
             padding-bottom: 0.3em;
             border-bottom: 1px solid #d0d7deff;
-        }}
+        }
         
-        h2 {{
+        h2 {
             font-size: 1.5em;
             padding-bottom: 0.3em;
             border-bottom: 1px solid #d0d7deff;
-        }}
+        }
         
-        h3 {{
+        h3 {
             font-size: 1.25em;
-        }}
+        }
         
-        code {{
+        code {
             padding: 0.2em 0.4em;
             margin: 0;
             font-size: 85%;
             background-color: rgba(175, 184, 193, 0.2);
             border-radius: 6px;
             font-family: ui-monospace, SFMono-Regular, 'SF Mono', Consolas, 'Liberation Mono', Menlo, monospace;
-        }}
+        }
         
-        pre {{
+        pre {
             padding: 16px;
             overflow: auto;
             font-size: 85%;
@@ -144,9 +331,9 @@ class MarkdownHandler(http.server.SimpleHTTPRequestHandler):
             background-color: #f6f8fa;
             border-radius: 6px;
             border: 1px solid #d0d7de;
-        }}
+        }
         
-        pre code {{
+        pre code {
             background-color: transparent;
             border: 0;
             display: inline;
@@ -155,73 +342,65 @@ class MarkdownHandler(http.server.SimpleHTTPRequestHandler):
             overflow: visible;
             padding: 0;
             word-wrap: normal;
-        }}
+        }
         
-        table {{
+        table {
             border-spacing: 0;
             border-collapse: collapse;
             width: 100%;
             margin-bottom: 16px;
-        }}
+        }
         
-        table th, table td {{
+        table th, table td {
             padding: 6px 13px;
             border: 1px solid #d0d7de;
-        }}
+        }
         
-        table th {{
+        table th {
             background-color: #f6f8fa;
             font-weight: 600;
-        }}
+        }
         
-        table tr:nth-child(2n) {{
+        table tr:nth-child(2n) {
             background-color: #f6f8fa;
-        }}
+        }
         
-        blockquote {{
+        blockquote {
             padding: 0 1em;
             color: #656d76;
             border-left: 0.25em solid #d0d7de;
             margin: 0 0 16px 0;
-        }}
+        }
         
-        ul, ol {{
+        ul, ol {
             padding-left: 2em;
             margin-bottom: 16px;
-        }}
+        }
         
-        li {{
+        li {
             margin: 0.25em 0;
-        }}
+        }
         
-        hr {{
+        hr {
             height: 0.25em;
             padding: 0;
             margin: 24px 0;
             background-color: #d0d7de;
             border: 0;
-        }}
-        
-        .highlight {{
-            background: #f8f8f8;
-            border: 1px solid #ccc;
-            border-radius: 4px;
-            padding: 10px;
-            overflow-x: auto;
-        }}
+        }
         
         /* Success indicators */
-        body {{
+        body {
             counter-reset: checkmark;
-        }}
+        }
         
-        p:has(✅)::before {{
+        p:has(✅)::before {
             content: "✅ ";
             color: #28a745;
-        }}
+        }
         
         /* Navigation */
-        .nav {{
+        .nav {
             background: #f6f8fa;
             padding: 10px 20px;
             margin: -20px -20px 20px -20px;
@@ -229,27 +408,27 @@ class MarkdownHandler(http.server.SimpleHTTPRequestHandler):
             position: sticky;
             top: 0;
             z-index: 100;
-        }}
+        }
         
-        .nav h1 {{
+        .nav h1 {
             margin: 0;
             font-size: 1.2em;
             border: none;
             padding: 0;
-        }}
+        }
         
         /* Responsive */
-        @media (max-width: 768px) {{
-            body {{
+        @media (max-width: 768px) {
+            body {
                 padding: 10px;
-            }}
-            .nav {{
+            }
+            .nav {
                 margin: -10px -10px 10px -10px;
-            }}
-        }}
+            }
+        }
     </style>
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/styles/github.min.css">
-    <script src="https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/highlight.min.js"></script>
+    <link rel="stylesheet" href="/static/github-11.9.0.min.css">
+    <script src="/static/highlight-11.9.0.min.js"></script>
     <script>hljs.highlightAll();</script>
 </head>
 <body>
@@ -261,16 +440,18 @@ class MarkdownHandler(http.server.SimpleHTTPRequestHandler):
             <a href="/README.md">Project README</a>
         </p>
     </div>
-    {content}
+    """.encode('utf-8')
+
+_PAGE_TAIL = """
     <footer style="margin-top: 40px; padding-top: 20px; border-top: 1px solid #d0d7de; text-align: center; color: #656d76;">
         <p>📖 Served by Python Markdown Server | 🎯 GitOps Implementation Complete</p>
     </footer>
     <script>
         // Initialize Mermaid
-        mermaid.initialize({{ 
+        mermaid.initialize({ 
             startOnLoad: true,
             theme: 'base',
-            themeVariables: {{
+            themeVariables: {
                 primaryColor: '#0969da',
                 primaryTextColor: '#24292f',
                 primaryBorderColor: '#1f2328',
@@ -281,13 +462,13 @@ class MarkdownHandler(http.server.SimpleHTTPRequestHandler):
                 mainBkg: '#f6f8fa',
                 secondBkg: '#ffffff',
                 tertiaryTextColor: '#24292f'
-            }},
-            flowchart: {{
+            },
+            flowchart: {
                 useMaxWidth: true,
                 htmlLabels: true,
                 curve: 'basis'
-            }},
-            sequence: {{
+            },
+            sequence: {
                 diagramMarginX: 50,
                 diagramMarginY: 10,
                 actorMargin: 50,
@@ -297,19 +478,19 @@ class MarkdownHandler(http.server.SimpleHTTPRequestHandler):
                 boxTextMargin: 5,
                 noteMargin: 10,
                 messageMargin: 35
-            }},
-            pie: {{
+            },
+            pie: {
                 textPosition: 0.75
-            }}
-        }});
+            }
+        });
         
         // Process any existing mermaid diagrams
         mermaid.run();
         
         // Style mermaid containers
-        document.addEventListener('DOMContentLoaded', function() {{
+        document.addEventListener('DOMContentLoaded', function() {
             const mermaidElements = document.querySelectorAll('.mermaid');
-            mermaidElements.forEach(element => {{
+            mermaidElements.forEach(element => {
                 element.style.textAlign = 'center';
                 element.style.background = '#ffffff';
                 element.style.border = '1px solid #d0d7de';
@@ -317,11 +498,137 @@ class MarkdownHandler(http.server.SimpleHTTPRequestHandler):
                 element.style.padding = '16px';
                 element.style.margin = '16px 0';
                 element.style.boxShadow = '0 1px 3px rgba(0,0,0,0.1)';
-            }});
-        }});
+            });
+        });
     </script>
 </body>
-</html>"""
+</html>""".encode('utf-8')
+
+@functools.lru_cache(maxsize=256)
+def create_html_page(content, title):
+    """Assemble the full page as UTF-8 bytes around the static chrome
+
+    Memoized: identical (content, title) pairs — e.g. the same document
+    re-rendered after a response-cache eviction — reuse the encoded page.
+    """
+    return b''.join((
+        _PAGE_HEAD,
+        title.encode('utf-8'),
+        _PAGE_MID,
+        content.encode('utf-8'),
+        _PAGE_TAIL,
+    ))
+
+class MarkdownHandler(http.server.SimpleHTTPRequestHandler):
+    # Keep-alive lets browsers reuse one socket for the page plus its assets
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        # Parse the path; urlsplit strips query and fragment in C code
+        path = unquote(urlsplit(self.path).path)
+
+        # Default to IMPLEMENTATION.md if accessing root
+        if path == '/':
+            path = '/IMPLEMENTATION_GUIDE.md'
+        
+        # Remove leading slash
+        if path.startswith('/'):
+            path = path[1:]
+        
+        # Check if it's a markdown file
+        if path.endswith('.md'):
+            # Reject traversal attempts before any filesystem I/O
+            target = (_DOCROOT / path).resolve()
+            if not str(target).startswith(str(_DOCROOT) + os.sep):
+                self.send_error(403, "Forbidden")
+                return
+
+            try:
+                # Check the rendered-response cache before doing any work
+                st = os.stat(path)
+                cache_key = _response_cache_key(path, st)
+
+                # The cache key already fingerprints path + content, so it
+                # doubles as the ETag; strong ETags are per-representation,
+                # so the gzip variant gets a suffixed tag. Repeat visits
+                # become empty 304s whichever variant the client validates.
+                accepts_gzip = 'gzip' in self.headers.get('Accept-Encoding', '')
+                etag = f'"{cache_key}-gz"' if accepts_gzip else f'"{cache_key}"'
+                if self.headers.get('If-None-Match') in (f'"{cache_key}"', f'"{cache_key}-gz"'):
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.end_headers()
+                    return
+
+                cached = _cache_get(cache_key)
+
+                if cached is None:
+                    cached = _render_document(path, st)
+                    _cache_put(cache_key, cached)
+
+                raw, gz = cached
+                body = gz if accepts_gzip else raw
+
+                # Send response
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                if accepts_gzip:
+                    self.send_header('Content-Encoding', 'gzip')
+                self.send_header('Vary', 'Accept-Encoding')
+                self.send_header('ETag', etag)
+                self.send_header('Cache-Control', 'public, max-age=60')
+                self.send_header('Content-Length', str(len(body)))
+                self._send_body(body)
+
+            except FileNotFoundError:
+                self.send_error(404, f"File not found: {path}")
+            except Exception as e:
+                self.send_error(500, f"Error processing markdown: {str(e)}")
+        else:
+            # Serve other files normally
+            super().do_GET()
+    
+    def _send_body(self, body):
+        """Send the buffered headers plus body as one socket write
+
+        Collects the pending header block and the body into a reusable
+        per-thread buffer so the whole response goes out in a single send
+        instead of one write for headers and another for the body.
+        """
+        buf = _response_buffer()
+        for chunk in self._headers_buffer:
+            buf += chunk
+        self._headers_buffer = []
+        buf += b'\r\n'
+        buf += body
+        self.wfile.write(memoryview(buf))
+
+    def end_headers(self):
+        # Static asset filenames carry their pinned version, so successful
+        # responses can be cached for a year. Only responses backed by an
+        # existing file get the header: a cacheable 404 (possible when the
+        # startup download failed) would stop browsers from ever retrying.
+        if (self.path.startswith('/static/')
+                and os.path.isfile(self.translate_path(self.path))):
+            self.send_header('Cache-Control', 'public, max-age=31536000, immutable')
+        super().end_headers()
+
+    def copyfile(self, source, outputfile):
+        """Copy a static file to the client, zero-copy when possible
+
+        For plain files going straight to the socket, socket.sendfile()
+        pushes the bytes in-kernel instead of round-tripping them through
+        userspace buffers. Falls back to the normal copy otherwise.
+        """
+        if outputfile is self.wfile and hasattr(source, 'fileno'):
+            try:
+                self.wfile.flush()
+                self.connection.sendfile(source)
+                return
+            except (OSError, ValueError):
+                pass  # e.g. source is not a regular file
+        super().copyfile(source, outputfile)
+
 
 def main():
     port = 8000
@@ -333,8 +640,19 @@ def main():
         print("📄 Available files:", os.listdir('.'))
         sys.exit(1)
     
+    # Fetch mermaid/highlight.js once so pages need no CDN round trips
+    _ensure_static_assets()
+
+    # Enable only the markdown plugins the served docs actually use
+    global MARKDOWN_PLUGINS
+    MARKDOWN_PLUGINS = _detect_plugins()
+    print(f"🔌 Markdown plugins: {', '.join(MARKDOWN_PLUGINS) or 'none'}")
+
+    # Pre-render the landing pages so the first visit is a cache hit too
+    _prerender(('IMPLEMENTATION_GUIDE.md', 'README.md'))
+
     try:
-        with socketserver.TCPServer(("", port), MarkdownHandler) as httpd:
+        with http.server.ThreadingHTTPServer(("", port), MarkdownHandler) as httpd:
             print("🚀 Starting Enhanced Markdown Server...")
             print(f"📖 Serving documentation at: http://localhost:{port}")
             print(f"📂 Current directory: {os.getcwd()}")